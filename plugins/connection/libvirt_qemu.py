@@ -39,11 +39,17 @@ DOCUMENTATION = """
 
 import base64
 import json
-import libvirt
-import libvirt_qemu
 import shlex
 import traceback
 
+try:
+    import libvirt
+    import libvirt_qemu
+except ImportError:
+    HAS_LIBVIRT = False
+else:
+    HAS_LIBVIRT = True
+
 from ansible import constants as C
 from ansible.errors import AnsibleError, AnsibleConnectionFailure, AnsibleFileNotFound
 from ansible.module_utils._text import to_bytes, to_native, to_text
@@ -78,6 +84,9 @@ class Connection(ConnectionBase):
     def __init__(self, play_context, new_stdin, *args, **kwargs):
         super(Connection, self).__init__(play_context, new_stdin, *args, **kwargs)
 
+        if not HAS_LIBVIRT:
+            raise AnsibleError('the libvirt_qemu connection plugin requires libvirt-python.')
+
         self._host = self._play_context.remote_addr
 
         # Windows operates differently from a POSIX connection/shell plugin,
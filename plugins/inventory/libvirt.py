@@ -55,13 +55,18 @@ from ansible.errors import AnsibleError
 try:
     import libvirt
 except ImportError:
-    raise AnsibleError('the libvirt inventory plugin requires libvirt-python.')
+    HAS_LIBVIRT = False
+else:
+    HAS_LIBVIRT = True
 
 
 class InventoryModule(BaseInventoryPlugin, Constructable):
     NAME = 'community.libvirt.libvirt'
 
     def parse(self, inventory, loader, path, cache=True):
+        if not HAS_LIBVIRT:
+            raise AnsibleError('the libvirt inventory plugin requires libvirt-python.')
+
         super(InventoryModule, self).parse(
             inventory,
             loader,
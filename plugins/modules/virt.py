@@ -139,6 +139,7 @@ except ImportError:
 else:
     HAS_VIRT = True
 
+import os
 import re
 
 from ansible.module_utils.basic import AnsibleModule
@@ -155,6 +156,17 @@ HOST_COMMANDS = ['freemem', 'info', 'list_vms', 'nodeinfo', 'virttype']
 ALL_COMMANDS.extend(VM_COMMANDS)
 ALL_COMMANDS.extend(HOST_COMMANDS)
 
+ARGUMENT_SPEC = dict(
+    name=dict(type='str', aliases=['guest']),
+    state=dict(type='str', choices=['destroyed', 'paused', 'running', 'shutdown']),
+    autostart=dict(type='bool'),
+    command=dict(type='str', choices=ALL_COMMANDS),
+    uri=dict(type='str', default='qemu:///system'),
+    xml=dict(type='str'),
+)
+
+DOMAIN_NAME_RE = re.compile('<name>(.*)</name>')
+
 VIRT_STATE_NAME_MAP = {
     0: 'running',
     1: 'running',
@@ -176,10 +188,9 @@ class LibvirtConnection(object):
 
         self.module = module
 
-        cmd = "uname -r"
-        rc, stdout, stderr = self.module.run_command(cmd)
-
-        if "xen" in stdout:
+        # os.uname() gives the same release string as `uname -r` without
+        # spawning a process every time a connection is opened
+        if "xen" in os.uname()[2]:
             conn = libvirt.open(None)
         elif "esx" in uri:
             auth = [[libvirt.VIR_CRED_AUTHNAME, libvirt.VIR_CRED_NOECHOPROMPT], [], None]
@@ -196,30 +207,17 @@ class LibvirtConnection(object):
         """
         Extra bonus feature: vmid = -1 returns a list of everything
         """
-        conn = self.conn
-
-        vms = []
-
-        # this block of code borrowed from virt-manager:
-        # get working domain's name
-        ids = conn.listDomainsID()
-        for id in ids:
-            vm = conn.lookupByID(id)
-            vms.append(vm)
-        # get defined domain
-        names = conn.listDefinedDomains()
-        for name in names:
-            vm = conn.lookupByName(name)
-            vms.append(vm)
-
+        # fetch running and defined domains in a single call rather than
+        # one lookup per domain
         if vmid == -1:
-            return vms
+            return self.conn.listAllDomains()
 
-        for vm in vms:
-            if vm.name() == vmid:
-                return vm
-
-        raise VMNotFound("virtual machine %s not found" % vmid)
+        try:
+            return self.conn.lookupByName(vmid)
+        except libvirtError as e:
+            if e.get_error_code() == libvirt.VIR_ERR_NO_DOMAIN:
+                raise VMNotFound("virtual machine %s not found" % vmid)
+            raise
 
     def shutdown(self, vmid):
         return self.find_vm(vmid).shutdown()
@@ -291,9 +289,12 @@ class Virt(object):
     def __init__(self, uri, module):
         self.module = module
         self.uri = uri
+        self.conn = None
 
     def __get_conn(self):
-        self.conn = LibvirtConnection(self.uri, self.module)
+        # open the hypervisor connection once and reuse it for every call
+        if self.conn is None:
+            self.conn = LibvirtConnection(self.uri, self.module)
         return self.conn
 
     def get_vm(self, vmid):
@@ -447,7 +448,7 @@ class Virt(object):
         """
 
         self.__get_conn()
-        return self.conn.get_MaxMemory(vmid)
+        return self.conn.get_maxMemory(vmid)
 
     def define(self, xml):
         """
@@ -490,23 +491,24 @@ def core(module):
         if not guest:
             module.fail_json(msg="state change requires a guest specified")
 
+        status = v.status(guest)
         if state == 'running':
-            if v.status(guest) == 'paused':
+            if status == 'paused':
                 res['changed'] = True
                 res['msg'] = v.unpause(guest)
-            elif v.status(guest) != 'running':
+            elif status != 'running':
                 res['changed'] = True
                 res['msg'] = v.start(guest)
         elif state == 'shutdown':
-            if v.status(guest) != 'shutdown':
+            if status != 'shutdown':
                 res['changed'] = True
                 res['msg'] = v.shutdown(guest)
         elif state == 'destroyed':
-            if v.status(guest) != 'shutdown':
+            if status != 'shutdown':
                 res['changed'] = True
                 res['msg'] = v.destroy(guest)
         elif state == 'paused':
-            if v.status(guest) == 'running':
+            if status == 'running':
                 res['changed'] = True
                 res['msg'] = v.pause(guest)
         else:
@@ -523,7 +525,7 @@ def core(module):
                     # there might be a mismatch between quest 'name' in the module and in the xml
                     module.warn("'xml' is given - ignoring 'name'")
                 try:
-                    domain_name = re.search('<name>(.*)</name>', xml).groups()[0]
+                    domain_name = DOMAIN_NAME_RE.search(xml).groups()[0]
                 except AttributeError:
                     module.fail_json(msg="Could not find domain 'name' in xml")
 
@@ -577,16 +579,7 @@ def core(module):
 
 
 def main():
-    module = AnsibleModule(
-        argument_spec=dict(
-            name=dict(type='str', aliases=['guest']),
-            state=dict(type='str', choices=['destroyed', 'paused', 'running', 'shutdown']),
-            autostart=dict(type='bool'),
-            command=dict(type='str', choices=ALL_COMMANDS),
-            uri=dict(type='str', default='qemu:///system'),
-            xml=dict(type='str'),
-        ),
-    )
+    module = AnsibleModule(argument_spec=ARGUMENT_SPEC)
 
     if not HAS_VIRT:
         module.fail_json(msg='The `libvirt` module is not importable. Check the requirements.')
@@ -166,6 +166,27 @@ HOST_COMMANDS = ['list_nets', 'facts', 'info']
 ALL_COMMANDS.extend(ENTRY_COMMANDS)
 ALL_COMMANDS.extend(HOST_COMMANDS)
 
+ARGUMENT_SPEC = dict(
+    name=dict(aliases=['network']),
+    state=dict(choices=['active', 'inactive', 'present', 'absent']),
+    command=dict(choices=ALL_COMMANDS),
+    uri=dict(default='qemu:///system'),
+    xml=dict(),
+    autostart=dict(type='bool')
+)
+
+REQUIRED_IF = [
+    ('command', 'create', ['name']),
+    ('command', 'status', ['name']),
+    ('command', 'start', ['name']),
+    ('command', 'stop', ['name']),
+    ('command', 'undefine', ['name']),
+    ('command', 'destroy', ['name']),
+    ('command', 'get_xml', ['name']),
+    ('command', 'define', ['name']),
+    ('command', 'modify', ['name']),
+]
+
 ENTRY_STATE_ACTIVE_MAP = {
     0: "inactive",
     1: "active"
@@ -198,18 +219,22 @@ class LibvirtConnection(object):
             raise Exception("hypervisor connection failure")
 
         self.conn = conn
+        self.entries = {}
 
     def find_entry(self, entryid):
-        if entryid == -1:  # Get active entries
-            names = self.conn.listNetworks() + self.conn.listDefinedNetworks()
-            return [self.conn.networkLookupByName(n) for n in names]
+        if entryid == -1:  # Get active and inactive entries in a single call
+            return self.conn.listAllNetworks()
 
-        try:
-            return self.conn.networkLookupByName(entryid)
-        except libvirt.libvirtError as e:
-            if e.get_error_code() == libvirt.VIR_ERR_NO_NETWORK:
-                raise EntryNotFound("network %s not found" % entryid)
-            raise
+        # network handles stay valid while the connection is open, so each
+        # one only needs to be looked up once
+        if entryid not in self.entries:
+            try:
+                self.entries[entryid] = self.conn.networkLookupByName(entryid)
+            except libvirt.libvirtError as e:
+                if e.get_error_code() == libvirt.VIR_ERR_NO_NETWORK:
+                    raise EntryNotFound("network %s not found" % entryid)
+                raise
+        return self.entries[entryid]
 
     def create(self, entryid):
         if not self.module.check_mode:
@@ -266,7 +291,10 @@ class LibvirtConnection(object):
 
     def destroy(self, entryid):
         if not self.module.check_mode:
-            return self.find_entry(entryid).destroy()
+            # a transient entry no longer exists once destroyed
+            entry = self.find_entry(entryid)
+            self.entries.pop(entryid, None)
+            return entry.destroy()
         else:
             if self.find_entry(entryid).isActive():
                 return self.module.exit_json(changed=True)
@@ -280,7 +308,8 @@ class LibvirtConnection(object):
             found = False
 
         if found:
-            return self.find_entry(entryid).undefine()
+            self.entries.pop(entryid, None)
+            return entry.undefine()
 
         if self.module.check_mode:
             return self.module.exit_json(changed=found)
@@ -601,26 +630,9 @@ def core(module):
 def main():
 
     module = AnsibleModule(
-        argument_spec=dict(
-            name=dict(aliases=['network']),
-            state=dict(choices=['active', 'inactive', 'present', 'absent']),
-            command=dict(choices=ALL_COMMANDS),
-            uri=dict(default='qemu:///system'),
-            xml=dict(),
-            autostart=dict(type='bool')
-        ),
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True,
-        required_if=[
-            ('command', 'create', ['name']),
-            ('command', 'status', ['name']),
-            ('command', 'start', ['name']),
-            ('command', 'stop', ['name']),
-            ('command', 'undefine', ['name']),
-            ('command', 'destroy', ['name']),
-            ('command', 'get_xml', ['name']),
-            ('command', 'define', ['name']),
-            ('command', 'modify', ['name']),
-        ]
+        required_if=REQUIRED_IF,
     )
 
     if not HAS_VIRT:
@@ -214,6 +214,16 @@ ALL_MODES = []
 ALL_MODES.extend(ENTRY_BUILD_FLAGS_MAP.keys())
 ALL_MODES.extend(ENTRY_DELETE_FLAGS_MAP.keys())
 
+ARGUMENT_SPEC = dict(
+    name=dict(aliases=['pool']),
+    state=dict(choices=['active', 'inactive', 'present', 'absent', 'undefined', 'deleted']),
+    command=dict(choices=ALL_COMMANDS),
+    uri=dict(default='qemu:///system'),
+    xml=dict(),
+    autostart=dict(type='bool'),
+    mode=dict(choices=ALL_MODES),
+)
+
 
 class EntryNotFound(Exception):
     pass
@@ -231,30 +241,24 @@ class LibvirtConnection(object):
             raise Exception("hypervisor connection failure")
 
         self.conn = conn
+        self.entries = {}
 
     def find_entry(self, entryid):
         # entryid = -1 returns a list of everything
-
-        results = []
-
-        # Get active entries
-        for name in self.conn.listStoragePools():
-            entry = self.conn.storagePoolLookupByName(name)
-            results.append(entry)
-
-        # Get inactive entries
-        for name in self.conn.listDefinedStoragePools():
-            entry = self.conn.storagePoolLookupByName(name)
-            results.append(entry)
-
         if entryid == -1:
-            return results
+            # active and inactive pools in a single call
+            return self.conn.listAllStoragePools()
 
-        for entry in results:
-            if entry.name() == entryid:
-                return entry
-
-        raise EntryNotFound("storage pool %s not found" % entryid)
+        # pool handles stay valid while the connection is open, so each one
+        # only needs to be looked up once
+        if entryid not in self.entries:
+            try:
+                self.entries[entryid] = self.conn.storagePoolLookupByName(entryid)
+            except libvirt.libvirtError as e:
+                if e.get_error_code() == libvirt.VIR_ERR_NO_STORAGE_POOL:
+                    raise EntryNotFound("storage pool %s not found" % entryid)
+                raise
+        return self.entries[entryid]
 
     def create(self, entryid):
         if not self.module.check_mode:
@@ -269,14 +273,19 @@ class LibvirtConnection(object):
 
     def destroy(self, entryid):
         if not self.module.check_mode:
-            return self.find_entry(entryid).destroy()
+            # a transient entry no longer exists once destroyed
+            entry = self.find_entry(entryid)
+            self.entries.pop(entryid, None)
+            return entry.destroy()
         else:
             if self.find_entry(entryid).isActive():
                 return self.module.exit_json(changed=True)
 
     def undefine(self, entryid):
         if not self.module.check_mode:
-            return self.find_entry(entryid).undefine()
+            entry = self.find_entry(entryid)
+            self.entries.pop(entryid, None)
+            return entry.undefine()
         else:
             if not self.find_entry(entryid):
                 return self.module.exit_json(changed=True)
@@ -674,15 +683,7 @@ def core(module):
 def main():
 
     module = AnsibleModule(
-        argument_spec=dict(
-            name=dict(aliases=['pool']),
-            state=dict(choices=['active', 'inactive', 'present', 'absent', 'undefined', 'deleted']),
-            command=dict(choices=ALL_COMMANDS),
-            uri=dict(default='qemu:///system'),
-            xml=dict(),
-            autostart=dict(type='bool'),
-            mode=dict(choices=ALL_MODES),
-        ),
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True
     )
 
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2020, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+import pytest
+
+from ansible_collections.community.libvirt.plugins.modules import virt
+
+from ansible_collections.community.libvirt.tests.unit.compat import mock
+
+
+virt.libvirt = None
+virt.HAS_VIRT = True
+
+
+class DummyDomain():
+    def __init__(self, name, state=1):
+        self._name = name
+        self._state = state
+
+    def name(self):
+        return self._name
+
+    def info(self):
+        return [self._state, 0, 0, 1, 0]
+
+
+class DummyLibvirtError(Exception):
+    def __init__(self, error_code):
+        super(DummyLibvirtError, self).__init__(error_code)
+        self.error_code = error_code
+
+    def get_error_code(self):
+        return self.error_code
+
+
+class DummyLibvirtConn():
+    def __init__(self):
+        self._domains = [
+            DummyDomain("running_vm", state=1),
+            DummyDomain("shutdown_vm", state=5)]
+
+    def listAllDomains(self):
+        return list(self._domains)
+
+    def lookupByName(self, name):
+        for i in self._domains:
+            if i.name() == name:
+                return i
+        raise DummyLibvirtError(DummyLibvirt.VIR_ERR_NO_DOMAIN)
+
+
+class DummyLibvirt():
+    VIR_ERR_NO_DOMAIN = 'VIR_ERR_NO_DOMAIN'
+
+    open = mock.Mock(side_effect=lambda uri: DummyLibvirtConn())
+
+    libvirtError = DummyLibvirtError
+
+
+@pytest.fixture
+def dummy_libvirt(monkeypatch):
+    DummyLibvirt.open.reset_mock()
+    monkeypatch.setattr(virt, 'libvirt', DummyLibvirt)
+    monkeypatch.setattr(virt, 'libvirtError', DummyLibvirtError, raising=False)
+    return DummyLibvirt
+
+
+@pytest.fixture
+def virt_obj(dummy_libvirt):
+    return virt.Virt('qemu:///nowhere', mock.MagicMock())
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2020, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+import pytest
+
+from ansible_collections.community.libvirt.plugins.modules import virt
+
+from ansible_collections.community.libvirt.tests.unit.compat import mock
+
+
+def test_virt_list_vms(virt_obj):
+    assert sorted(virt_obj.list_vms()) == ['running_vm', 'shutdown_vm']
+
+
+def test_virt_list_vms_by_state(virt_obj):
+    assert virt_obj.list_vms(state='shutdown') == ['shutdown_vm']
+
+
+def test_virt_get_vm(virt_obj):
+    assert virt_obj.get_vm('running_vm').name() == 'running_vm'
+
+
+def test_virt_get_vm_not_found(virt_obj):
+    with pytest.raises(virt.VMNotFound):
+        virt_obj.get_vm('missing_vm')
+
+
+def test_virt_get_vm_other_error(virt_obj, dummy_libvirt):
+    virt_obj.get_vm('running_vm')
+    virt_obj.conn.conn.lookupByName = mock.Mock(side_effect=dummy_libvirt.libvirtError('VIR_ERR_RPC'))
+    with pytest.raises(dummy_libvirt.libvirtError):
+        virt_obj.get_vm('running_vm')
+
+
+def test_virt_reuses_connection(virt_obj, dummy_libvirt):
+    virt_obj.status('running_vm')
+    virt_obj.status('shutdown_vm')
+    virt_obj.list_vms()
+    assert dummy_libvirt.open.call_count == 1
@@ -31,6 +31,9 @@ class DummyLibvirtConn():
             DummyNetwork("inactive_net", isActive=False),
             DummyNetwork("active_net", isActive=True)]
 
+    def listAllNetworks(self):
+        return list(self._network)
+
     def listNetworks(self):
         return [i.name() for i in self._network]
 
@@ -28,3 +28,16 @@ def test_virt_stop_active(virt_net_obj, monkeypatch):
     virt_net_obj.conn.destroy = mock.Mock()
     virt_net_obj.stop('active_net')
     virt_net_obj.conn.destroy.assert_called_with('active_net')
+
+
+def test_virt_net_lookup_cached(virt_net_obj):
+    lookup = mock.Mock(side_effect=virt_net_obj.conn.conn.networkLookupByName)
+    virt_net_obj.conn.conn.networkLookupByName = lookup
+    virt_net_obj.status('active_net')
+    virt_net_obj.status('active_net')
+    assert lookup.call_count == 1
+
+
+def test_virt_net_list_nets(virt_net_obj):
+    assert virt_net_obj.list_nets() == ['inactive_net', 'active_net']
+    assert virt_net_obj.list_nets(state='active') == ['active_net']